@@ -18,10 +18,13 @@ class CrawlerConfig:
         base_url: The root URL of the documentation site to crawl.
         output_filename: The name of the output PDF file.
         max_depth: Maximum crawl depth to prevent infinite recursion.
-        crawl_delay: Delay (in seconds) between requests for politeness.
+        crawl_delay: Delay (in seconds) between crawl levels when pages are
+            fetched over plain HTTP, for politeness.
         user_agent: Custom User-Agent header for HTTP requests.
         timeout: Request timeout in seconds.
         max_retries: Number of retry attempts for failed requests.
+        concurrency: Number of pages fetched in parallel, each in its own
+            browser context.
     """
     base_url: str
     output_filename: str = "documentation.pdf"
@@ -33,6 +36,7 @@ class CrawlerConfig:
     )
     timeout: int = 30
     max_retries: int = 3
+    concurrency: int = 4
     
 
 # Default configuration for the HP Anyware Manager documentation
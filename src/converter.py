@@ -2,29 +2,166 @@
 HTML to PDF Converter.
 
 This module provides functionality to convert HTML content to PDF format
-using pdfkit (wkhtmltopdf wrapper). It saves HTML to local files and
-disables external resource loading to work with pre-fetched content.
+using wkhtmltopdf. It saves HTML to local files and disables external
+resource loading to work with pre-fetched content.
 """
 
+import hashlib
 import logging
 import tempfile
 import os
 import re
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from dataclasses import dataclass
 
-import pdfkit
-from bs4 import BeautifulSoup
-
 from .crawler import CrawledPage
 
+# BeautifulSoup is imported where it is used, so importing this module
+# doesn't load it (or lxml)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, Tag
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-def sanitize_html(html_content: str) -> str:
+# Common class patterns for navigation/overlay elements
+NAV_CLASS_PATTERNS = [
+    'nav', 'menu', 'sidebar', 'header', 'footer', 'breadcrumb',
+    'toc', 'navigation', 'toolbar', 'topbar', 'top-bar',
+    'navbar', 'nav-bar', 'sidenav', 'side-nav', 'side-menu',
+    'mobile-menu', 'hamburger', 'overlay', 'modal', 'popup',
+    'cookie', 'banner', 'search-box', 'search-form',
+    # MkDocs Material theme specific
+    'md-header', 'md-sidebar', 'md-footer', 'md-search', 'md-overlay',
+    'md-tabs', 'md-source', 'headerlink'
+]
+
+# Common ID patterns for navigation/overlay elements
+NAV_ID_PATTERNS = ['nav', 'menu', 'sidebar', 'header', 'footer', 'toc', 'navigation', 'toolbar']
+
+# Compiled once at import so sanitize_html() never recompiles per page
+_NAV_CLASS_RE = re.compile('|'.join(map(re.escape, NAV_CLASS_PATTERNS)), re.IGNORECASE)
+_NAV_ID_RE = re.compile('|'.join(map(re.escape, NAV_ID_PATTERNS)), re.IGNORECASE)
+
+# Inline styles that position an element as an overlay
+_STYLE_POS_RE = re.compile(r'position\s*:\s*(fixed|absolute)', re.IGNORECASE)
+
+# Class/ID patterns identifying the main content area of a page
+_MAIN_CLASS_RE = re.compile(r'(content|main|article|documentation|docs)', re.IGNORECASE)
+_MAIN_ID_RE = re.compile(r'(content|main)', re.IGNORECASE)
+
+
+def _is_navigation_element(tag: 'Tag') -> bool:
+    """
+    Check if a tag's class or ID marks it as navigation or an overlay.
+    
+    Args:
+        tag: The BeautifulSoup Tag to check.
+        
+    Returns:
+        True if any class name or the ID matches a navigation pattern.
+    """
+    classes = tag.get('class')
+    if classes and _NAV_CLASS_RE.search(' '.join(classes)):
+        return True
+    element_id = tag.get('id')
+    return bool(element_id and _NAV_ID_RE.search(element_id))
+
+
+def _is_positioned_overlay(tag: 'Tag') -> bool:
+    """
+    Check if a tag has fixed or absolute positioning (it overlays content).
+    
+    Elements whose class marks them as main content are never treated as
+    overlays.
+    
+    Args:
+        tag: The BeautifulSoup Tag to check.
+        
+    Returns:
+        True if the inline style positions the element as an overlay.
+    """
+    style = tag.get('style')
+    if not style or not _STYLE_POS_RE.search(style):
+        return False
+    element_classes = ' '.join(tag.get('class', [])).lower()
+    return 'content' not in element_classes and 'main' not in element_classes
+
+
+# Tags removed from every page together with their content
+_REMOVED_TAGS = frozenset(['nav', 'header', 'footer', 'aside', 'script', 'noscript'])
+
+
+def _prune(soup: 'BeautifulSoup') -> List['Tag']:
+    """
+    Remove navigation and overlay elements in one walk over the tree.
+    
+    An element is removed with its subtree if its tag is in _REMOVED_TAGS,
+    its class or ID matches a navigation pattern, or it is positioned as
+    an overlay. Removed subtrees are not descended into.
+    
+    Args:
+        soup: The parsed document, modified in place.
+        
+    Returns:
+        The remaining <a> elements, in document order.
+    """
+    anchors: List['Tag'] = []
+    # Children are pushed in reverse so nodes are visited in document order
+    stack = [child for child in reversed(soup.contents) if child.name]
+    while stack:
+        element = stack.pop()
+        if (element.name in _REMOVED_TAGS
+                or _is_navigation_element(element)
+                or _is_positioned_overlay(element)):
+            element.decompose()
+            continue
+        if element.name == 'a':
+            anchors.append(element)
+        stack.extend(child for child in reversed(element.contents) if child.name)
+    return anchors
+
+
+# CSS added to every sanitized page to hide any remaining overlay elements
+# and clean up link styling
+CLEANUP_CSS = """
+    /* Hide any remaining overlay elements */
+    [style*="position: fixed"], [style*="position:fixed"],
+    [style*="position: absolute"], [style*="position:absolute"] {
+        display: none !important;
+    }
+    /* Hide appended URLs that might be added by print stylesheets */
+    a[href]:after { content: none !important; }
+    @media print { a[href]:after { content: none !important; } }
+    /* Ensure links don't have problematic styling */
+    a { position: static !important; display: inline !important; }
+    /* Clean up the layout */
+    body { max-width: 100%; overflow-x: hidden; }
+    /* MkDocs Material theme specific fixes */
+    .md-header, .md-sidebar, .md-footer, .md-tabs, .md-search,
+    .md-source, .md-overlay { display: none !important; }
+    /* Hide headerlink anchors that appear next to headings */
+    .headerlink, a.headerlink, .anchor-link { display: none !important; }
+    /* Remove sticky/fixed positioning */
+    * { position: static !important; }
+    .md-content, .md-content__inner, .md-typeset, article, main {
+        position: static !important;
+        margin: 0 !important;
+        padding: 10px !important;
+        max-width: 100% !important;
+        width: 100% !important;
+    }
+"""
+
+
+def sanitize_html(html_content: str, base_url: Optional[str] = None,
+                  stylesheet_url: Optional[str] = None) -> str:
     """
     Sanitize HTML content by removing navigation elements and overlays.
     
@@ -36,54 +173,24 @@ def sanitize_html(html_content: str) -> str:
     
     Args:
         html_content: The raw HTML content to sanitize.
+        base_url: Optional page URL, added as a <base> tag so relative
+                  URLs resolve against the original page.
+        stylesheet_url: Optional URL of a stylesheet containing CLEANUP_CSS.
+                        If given, it is linked instead of embedding the CSS
+                        in every page.
         
     Returns:
         Sanitized HTML content suitable for PDF conversion.
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    
-    # Remove common navigation and overlay elements by tag
-    tags_to_remove = ['nav', 'header', 'footer', 'aside', 'script', 'noscript']
-    for tag in tags_to_remove:
-        for element in soup.find_all(tag):
-            element.decompose()
-    
-    # Common class patterns for navigation/overlay elements
-    nav_class_patterns = [
-        'nav', 'menu', 'sidebar', 'header', 'footer', 'breadcrumb',
-        'toc', 'navigation', 'toolbar', 'topbar', 'top-bar',
-        'navbar', 'nav-bar', 'sidenav', 'side-nav', 'side-menu',
-        'mobile-menu', 'hamburger', 'overlay', 'modal', 'popup',
-        'cookie', 'banner', 'search-box', 'search-form',
-        # MkDocs Material theme specific
-        'md-header', 'md-sidebar', 'md-footer', 'md-search', 'md-overlay',
-        'md-tabs', 'md-source', 'headerlink'
-    ]
-    
-    # Remove elements with navigation-related classes
-    for pattern in nav_class_patterns:
-        # Match class names that contain the pattern
-        for element in soup.find_all(class_=re.compile(pattern, re.IGNORECASE)):
-            element.decompose()
+    from bs4 import BeautifulSoup
     
-    # Remove elements with navigation-related IDs
-    nav_id_patterns = ['nav', 'menu', 'sidebar', 'header', 'footer', 'toc', 'navigation', 'toolbar']
-    for pattern in nav_id_patterns:
-        for element in soup.find_all(id=re.compile(pattern, re.IGNORECASE)):
-            element.decompose()
-    
-    # Remove elements with fixed or absolute positioning (they overlay content)
-    for element in soup.find_all(style=True):
-        style = element.get('style', '').lower()
-        if 'position:' in style.replace(' ', ''):
-            if 'fixed' in style or 'absolute' in style:
-                # Check if this is a main content element - don't remove those
-                element_classes = ' '.join(element.get('class', []))
-                if 'content' not in element_classes.lower() and 'main' not in element_classes.lower():
-                    element.decompose()
+    soup = BeautifulSoup(html_content, 'lxml')
     
-    # Remove empty anchor tags that might cause overlay issues
-    for anchor in soup.find_all('a'):
+    # Remove navigation, overlay and script elements in a single tree walk,
+    # then the anchors left without visible content
+    for anchor in _prune(soup):
+        if anchor.decomposed:
+            continue  # Already removed along with an enclosing empty anchor
         # Remove anchors that are purely for navigation (no visible text)
         text = anchor.get_text(strip=True)
         if not text and not anchor.find('img'):
@@ -92,64 +199,52 @@ def sanitize_html(html_content: str) -> str:
     # Try to extract just the main content if a main content area exists
     main_content = (
         soup.find('main') or 
-        soup.find(class_=re.compile(r'(content|main|article|documentation|docs)', re.IGNORECASE)) or
+        soup.find(class_=_MAIN_CLASS_RE) or
         soup.find('article') or
-        soup.find(id=re.compile(r'(content|main)', re.IGNORECASE))
+        soup.find(id=_MAIN_ID_RE)
     )
     
     if main_content:
-        # Wrap main content in basic HTML structure
-        new_soup = BeautifulSoup('<html><head></head><body></body></html>', 'lxml')
+        # Wrap main content in basic HTML structure, built from the existing
+        # soup instead of parsing a new document
+        new_html = soup.new_tag('html')
+        new_head = soup.new_tag('head')
+        new_body = soup.new_tag('body')
+        new_html.append(new_head)
+        new_html.append(new_body)
         
         # Copy head elements (title, meta, styles) if they exist
         if soup.head:
-            for child in soup.head.children:
-                if hasattr(child, 'name') and child.name in ['title', 'meta', 'style']:
-                    new_soup.head.append(child.extract())
+            for child in list(soup.head.children):
+                if child.name in ['title', 'meta', 'style']:
+                    new_head.append(child.extract())
         
         # Add main content to body
-        new_soup.body.append(main_content.extract())
-        soup = new_soup
+        new_body.append(main_content.extract())
+        soup.clear()
+        soup.append(new_html)
     
     # Add CSS to hide any remaining overlay elements and clean up link styling
-    cleanup_css = """
-    <style>
-        /* Hide any remaining overlay elements */
-        [style*="position: fixed"], [style*="position:fixed"],
-        [style*="position: absolute"], [style*="position:absolute"] {
-            display: none !important;
-        }
-        /* Hide appended URLs that might be added by print stylesheets */
-        a[href]:after { content: none !important; }
-        @media print { a[href]:after { content: none !important; } }
-        /* Ensure links don't have problematic styling */
-        a { position: static !important; display: inline !important; }
-        /* Clean up the layout */
-        body { max-width: 100%; overflow-x: hidden; }
-        /* MkDocs Material theme specific fixes */
-        .md-header, .md-sidebar, .md-footer, .md-tabs, .md-search,
-        .md-source, .md-overlay { display: none !important; }
-        /* Hide headerlink anchors that appear next to headings */
-        .headerlink, a.headerlink, .anchor-link { display: none !important; }
-        /* Remove sticky/fixed positioning */
-        * { position: static !important; }
-        .md-content, .md-content__inner, .md-typeset, article, main {
-            position: static !important;
-            margin: 0 !important;
-            padding: 10px !important;
-            max-width: 100% !important;
-            width: 100% !important;
-        }
-    </style>
-    """
-    
     if soup.head:
-        soup.head.append(BeautifulSoup(cleanup_css, 'lxml'))
+        if stylesheet_url:
+            style_tag = soup.new_tag('link', rel='stylesheet', href=stylesheet_url)
+        else:
+            style_tag = soup.new_tag('style')
+            style_tag.string = CLEANUP_CSS
+        soup.head.append(style_tag)
+    
+    # Add base tag to help resolve relative URLs
+    if base_url:
+        base_tag = soup.new_tag('base', href=base_url)
+        if soup.head:
+            soup.head.insert(0, base_tag)
+        else:
+            soup.insert(0, base_tag)
     
     return str(soup)
 
 
-# pdfkit options - configured to work with local HTML without network access
+# wkhtmltopdf options - configured to work with local HTML without network access
 PDF_OPTIONS = {
     'page-size': 'A4',
     'margin-top': '20mm',
@@ -170,6 +265,78 @@ PDF_OPTIONS = {
     'load-media-error-handling': 'skip', # Skip failed media loads
 }
 
+# Options for batch mode, where a single wkhtmltopdf run renders every page:
+# the outline (built from page headings) and page numbers come from wkhtmltopdf
+# itself instead of the merge step
+BATCH_PDF_OPTIONS = {key: value for key, value in PDF_OPTIONS.items() if key != 'no-outline'}
+BATCH_PDF_OPTIONS.update({
+    'footer-center': '[page]/[topage]',
+    'footer-font-size': '9',
+})
+
+# Keeps wkhtmltopdf from opening a console window on Windows (0 elsewhere)
+_CREATION_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+
+def _wkhtmltopdf_args(options: dict) -> List[str]:
+    """
+    Convert an options dict into wkhtmltopdf command-line flags.
+    
+    Args:
+        options: Mapping of option name (without leading dashes) to its
+                 value, or None for flags without a value.
+        
+    Returns:
+        The flags in the order of the dict, e.g. ['--page-size', 'A4', '--quiet'].
+    """
+    args = []
+    for key, value in options.items():
+        args.append(f'--{key}')
+        if value is not None:
+            args.append(str(value))
+    return args
+
+
+# Command-line flags for both modes, built once instead of per page
+_PAGE_ARGS = _wkhtmltopdf_args(PDF_OPTIONS)
+_BATCH_ARGS = _wkhtmltopdf_args(BATCH_PDF_OPTIONS)
+
+# Default location of the rendered page cache shared between runs
+CACHE_DIR = Path.home() / '.cache' / 'web2pdf'
+
+# Part of every cache key. Bump it whenever sanitize_html() or the rendering
+# pipeline changes, so cached PDFs from older versions are not reused.
+CACHE_VERSION = '1'
+
+
+def _run_wkhtmltopdf(command: List[str]) -> None:
+    """
+    Run a wkhtmltopdf command line and wait for it to finish.
+    
+    Args:
+        command: The executable, flags, input file(s) and output file.
+        
+    Raises:
+        IOError: If wkhtmltopdf exits with an error.
+    """
+    result = subprocess.run(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=_CREATION_FLAGS,
+    )
+    if result.returncode == 0:
+        return
+    
+    stderr = (result.stderr or result.stdout).decode('utf-8', errors='replace')
+    # wkhtmltopdf sometimes exits non-zero even though it finished the document
+    lines = stderr.splitlines()
+    if len(lines) > 1 and lines[-2].strip() == 'Done':
+        return
+    raise IOError(f"wkhtmltopdf exited with code {result.returncode}: "
+                  f"{stderr.strip() or 'Unknown error'}")
+
 
 @dataclass
 class PDFConversionResult:
@@ -188,7 +355,7 @@ class PDFConversionResult:
 
 class PDFConverter:
     """
-    Converts HTML pages to PDF format using pdfkit (wkhtmltopdf).
+    Converts HTML pages to PDF format using wkhtmltopdf.
     
     This converter saves HTML content to local files and converts them
     with disabled network access to work with pre-fetched content.
@@ -200,21 +367,43 @@ class PDFConverter:
             print(f"PDF saved to: {result.pdf_path}")
     """
     
-    def __init__(self, wkhtmltopdf_path: Optional[str] = None):
+    def __init__(
+        self,
+        wkhtmltopdf_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize the PDF converter.
         
         Args:
             wkhtmltopdf_path: Optional path to wkhtmltopdf executable.
                               If not provided, uses system PATH.
+            max_workers: Number of pages to convert in parallel worker
+                         processes. Defaults to the number of CPUs.
+            cache_dir: Optional directory where rendered page PDFs are kept
+                       between runs (e.g. CACHE_DIR). Caching is disabled
+                       if not provided.
         """
         self.temp_dir = tempfile.mkdtemp(prefix="web2pdf_")
-        self.config = None
+        self.wkhtmltopdf_path = wkhtmltopdf_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Page cache disabled, cannot create {self.cache_dir}: {e}")
+                self.cache_dir = None
+        
+        # Cleanup CSS is written once and linked from every sanitized page
+        cleanup_css_path = Path(self.temp_dir) / 'cleanup.css'
+        cleanup_css_path.write_text(CLEANUP_CSS, encoding='utf-8')
+        self.cleanup_css_url = cleanup_css_path.as_uri()
         
         # Try to locate wkhtmltopdf
-        if wkhtmltopdf_path:
-            self.config = pdfkit.configuration(wkhtmltopdf=wkhtmltopdf_path)
-        else:
+        if not self.wkhtmltopdf_path:
             # Try common Windows installation paths
             common_paths = [
                 r"C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe",
@@ -222,9 +411,91 @@ class PDFConverter:
             ]
             for path in common_paths:
                 if os.path.exists(path):
-                    self.config = pdfkit.configuration(wkhtmltopdf=path)
+                    self.wkhtmltopdf_path = path
                     logger.info(f"Found wkhtmltopdf at: {path}")
                     break
+            else:
+                self.wkhtmltopdf_path = shutil.which('wkhtmltopdf')
+    
+    def _command(self, args: List[str], *files: str) -> List[str]:
+        """
+        Build a wkhtmltopdf command line from prebuilt flags.
+        
+        Args:
+            args: The flags, e.g. _PAGE_ARGS.
+            *files: The input HTML file(s) followed by the output PDF path.
+            
+        Returns:
+            The full command line.
+            
+        Raises:
+            IOError: If wkhtmltopdf was not found.
+        """
+        if not self.wkhtmltopdf_path:
+            raise IOError("No wkhtmltopdf executable found; install it or pass its path")
+        return [self.wkhtmltopdf_path, *args, *files]
+    
+    def _cache_path(self, page: CrawledPage) -> Optional[str]:
+        """
+        Get the cache file for a page's rendered PDF.
+        
+        The key covers the page itself, the cleanup CSS, the wkhtmltopdf
+        executable and flags, and CACHE_VERSION, which stands in for the
+        sanitize_html() rules and the rest of the rendering code.
+        
+        Args:
+            page: The page being converted.
+            
+        Returns:
+            The cache file path, or None if caching is disabled.
+        """
+        if not self.cache_dir:
+            return None
+        key = hashlib.blake2b(digest_size=16)
+        parts = (CACHE_VERSION, self.wkhtmltopdf_path or '', page.url,
+                 page.html_content, CLEANUP_CSS, *_PAGE_ARGS)
+        for part in parts:
+            key.update(part.encode('utf-8'))
+            key.update(b'\0')
+        return os.path.join(self.cache_dir, f"{key.hexdigest()}.pdf")
+    
+    def _write_html(self, page: CrawledPage) -> str:
+        """
+        Sanitize a page and save it as a local HTML file for wkhtmltopdf.
+        
+        The filename includes a digest of the page content, so a page that
+        was already sanitized by this converter (e.g. on a retry or a second
+        conversion pass) reuses the existing file instead of being parsed
+        and serialized again.
+        
+        Args:
+            page: The CrawledPage to save.
+            
+        Returns:
+            Path to the written HTML file.
+        """
+        url_key = hashlib.blake2b(page.url.encode('utf-8'), digest_size=4).hexdigest()
+        content_key = hashlib.blake2b(page.html_content.encode('utf-8'), digest_size=16).hexdigest()
+        html_filename = os.path.join(self.temp_dir, f"page_{url_key}_{content_key}.html")
+        
+        if os.path.exists(html_filename):
+            logger.debug(f"Reusing sanitized HTML for {page.url}")
+            return html_filename
+        
+        # Sanitize HTML to remove navigation elements and overlays
+        html_content = sanitize_html(page.html_content, base_url=page.url,
+                                     stylesheet_url=self.cleanup_css_url)
+        
+        # Write HTML to local file, preceded by a source comment. Write to a
+        # partial file first so an interrupted write is never reused. Binary
+        # mode skips the text layer's newline translation of the document.
+        partial_filename = f"{html_filename}.{os.getpid()}.part"
+        with open(partial_filename, 'wb') as f:
+            f.write(f'<!-- Source: {page.url} -->\n'.encode('utf-8'))
+            f.write(html_content.encode('utf-8'))
+        os.replace(partial_filename, html_filename)
+        
+        return html_filename
     
     def convert_page(self, page: CrawledPage, output_path: str) -> PDFConversionResult:
         """
@@ -241,38 +512,22 @@ class PDFConverter:
             A PDFConversionResult indicating success or failure.
         """
         try:
-            # Save HTML to a local file first
-            html_filename = os.path.join(
-                self.temp_dir, 
-                f"page_{hash(page.url) & 0xFFFFFFFF:08x}.html"
-            )
-            
-            # Sanitize HTML to remove navigation elements and overlays
-            html_content = sanitize_html(page.html_content)
-            
-            # Add base tag to help resolve relative URLs and add source info
-            base_tag = f'<base href="{page.url}">'
-            source_comment = f'<!-- Source: {page.url} -->\n'
-            
-            # Insert base tag in head if possible
-            if '<head>' in html_content.lower():
-                html_content = html_content.replace('<head>', f'<head>\n{base_tag}', 1)
-            else:
-                html_content = f'{base_tag}\n{html_content}'
-            
-            html_content = source_comment + html_content
+            cache_path = self._cache_path(page)
+            if cache_path and os.path.exists(cache_path):
+                shutil.copyfile(cache_path, output_path)
+                return PDFConversionResult(pdf_path=output_path, success=True)
             
-            # Write HTML to local file
-            with open(html_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_filename = self._write_html(page)
             
             # Convert from local file (not string) to avoid encoding issues
-            pdfkit.from_file(
-                html_filename,
-                output_path,
-                options=PDF_OPTIONS,
-                configuration=self.config
-            )
+            _run_wkhtmltopdf(self._command(_PAGE_ARGS, html_filename, output_path))
+            
+            if cache_path and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                # Copy under a unique name first so concurrent runs never
+                # see a partially written cache entry
+                partial_path = f"{cache_path}.{os.getpid()}.part"
+                shutil.copyfile(output_path, partial_path)
+                os.replace(partial_path, cache_path)
             
             # Verify the PDF was created
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -293,6 +548,9 @@ class PDFConverter:
         """
         Convert multiple pages to individual PDF files.
         
+        Pages are converted in parallel worker processes (each running its
+        own wkhtmltopdf), and results are returned in the original page order.
+        
         Args:
             pages: List of CrawledPage objects to convert.
             
@@ -301,28 +559,78 @@ class PDFConverter:
         """
         results = []
         total = len(pages)
+        output_paths = [os.path.join(self.temp_dir, f"page_{i:04d}.pdf") for i in range(total)]
+        workers = min(self.max_workers, total)
+        
+        executor = None
+        if workers > 1:
+            logger.info(f"Converting {total} pages with {workers} worker processes...")
+            executor = ProcessPoolExecutor(max_workers=workers)
+            converted = executor.map(self.convert_page, pages, output_paths)
+        else:
+            converted = map(self.convert_page, pages, output_paths)
+        
+        try:
+            for i, (page, result) in enumerate(zip(pages, converted)):
+                # Log progress for each page
+                title_short = page.title[:50] if page.title else "Untitled"
+                logger.info(f"Converted page {i + 1}/{total}: {title_short}")
+                results.append(result)
+                
+                if result.success:
+                    logger.info(f"  ✓ Success: {result.pdf_path}")
+                else:
+                    logger.warning(f"  ✗ Failed: {result.error_message}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return results
+    
+    def convert_pages_batch(self, pages: List[CrawledPage], output_path: str) -> PDFConversionResult:
+        """
+        Convert all pages into a single PDF with one wkhtmltopdf invocation.
+        
+        This avoids starting wkhtmltopdf once per page. wkhtmltopdf adds page
+        numbers and builds the outline from page headings itself, so the
+        result does not need to go through PDFMerger. A page that fails to
+        render fails the whole batch.
         
-        for i, page in enumerate(pages):
-            # Log progress for each page
-            title_short = page.title[:50] if page.title else "Untitled"
-            logger.info(f"Converting page {i + 1}/{total}: {title_short}...")
+        Args:
+            pages: List of CrawledPage objects to convert, in document order.
+            output_path: Path where the combined PDF should be saved.
+            
+        Returns:
+            A PDFConversionResult for the combined PDF.
+        """
+        try:
+            html_files = []
+            for i, page in enumerate(pages):
+                title_short = page.title[:50] if page.title else "Untitled"
+                logger.info(f"Preparing page {i + 1}/{len(pages)}: {title_short}")
+                html_files.append(self._write_html(page))
             
-            output_path = os.path.join(self.temp_dir, f"page_{i:04d}.pdf")
-            result = self.convert_page(page, output_path)
-            results.append(result)
+            logger.info(f"Rendering {len(html_files)} pages in a single wkhtmltopdf run...")
+            _run_wkhtmltopdf(self._command(_BATCH_ARGS, *html_files, output_path))
             
-            if result.success:
-                logger.info(f"  ✓ Success: {output_path}")
+            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                return PDFConversionResult(pdf_path=output_path, success=True)
             else:
-                logger.warning(f"  ✗ Failed: {result.error_message}")
-        
-        return results
+                return PDFConversionResult(
+                    pdf_path=None, 
+                    success=False, 
+                    error_message="PDF file was not created or is empty"
+                )
+            
+        except Exception as e:
+            error_msg = f"Failed to convert pages in batch: {e}"
+            logger.error(error_msg)
+            return PDFConversionResult(pdf_path=None, success=False, error_message=error_msg)
     
     def cleanup(self):
         """
         Clean up temporary files created during conversion.
         """
-        import shutil
         try:
             shutil.rmtree(self.temp_dir)
             logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
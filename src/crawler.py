@@ -6,18 +6,22 @@ websites. It uses Playwright for browser-based page fetching with stealth
 techniques to handle JavaScript-rendered content and bypass bot detection.
 """
 
-import time
+import asyncio
+import hashlib
 import logging
 import random
-from collections import deque
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Tuple
-from urllib.parse import urlparse
-
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
+from typing import TYPE_CHECKING, Dict, List, Set, Optional, Tuple
 
 from .config import CrawlerConfig
-from .url_utils import normalize_url, rewrite_versioned_url, extract_links, get_page_title, is_internal_link, is_within_doc_path
+from .url_utils import normalize_url, rewrite_versioned_url, extract_links, parse_page, make_path_filter
+
+# requests, BeautifulSoup and Playwright are imported where they are used,
+# so importing this module (e.g. for `--help`) doesn't load them
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
 
 
 # Configure logging for the crawler module
@@ -36,6 +40,21 @@ ERROR_PAGE_PATTERNS = [
     "the requested page could not be found",
 ]
 
+# Lowercased needles actually scanned for, built once at import. Patterns that
+# contain a shorter pattern (e.g. "404 - page not found") can never change the
+# result, so they are dropped to save a full pass over the page per pattern.
+_ERROR_PAGE_PATTERNS_LOWER = [pattern.lower() for pattern in ERROR_PAGE_PATTERNS]
+_ERROR_PAGE_NEEDLES = tuple(
+    pattern for pattern in dict.fromkeys(_ERROR_PAGE_PATTERNS_LOWER)
+    if not any(other != pattern and other in pattern for other in _ERROR_PAGE_PATTERNS_LOWER)
+)
+
+
+# Charset declared by a <meta charset> or http-equiv Content-Type tag, looked
+# for in the start of a response body when its header doesn't name one
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_SCAN_BYTES = 4096
+
 
 def is_error_page(html_content: str) -> bool:
     """
@@ -51,10 +70,18 @@ def is_error_page(html_content: str) -> bool:
         True if the content appears to be an error page, False otherwise.
     """
     content_lower = html_content.lower()
-    for pattern in ERROR_PAGE_PATTERNS:
-        if pattern in content_lower:
-            return True
-    return False
+    return any(needle in content_lower for needle in _ERROR_PAGE_NEEDLES)
+
+
+# Serializes the rendered page like page.content(), but without <script>
+# elements: they are never used downstream (the converter drops them) and
+# bundled scripts are often most of the document's size.
+_SERIALIZE_PAGE_JS = """() => {
+    const root = document.documentElement.cloneNode(true);
+    root.querySelectorAll('script').forEach(el => el.remove());
+    const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+    return doctype + root.outerHTML;
+}"""
 
 
 @dataclass
@@ -89,6 +116,21 @@ class CrawlResult:
     skipped_urls: List[str] = field(default_factory=list)
 
 
+@dataclass
+class _BrowserSlot:
+    """
+    A browser context and page that serves one request at a time.
+    
+    Attributes:
+        context: The browser context (own cookies and fingerprint).
+        page: The page used for navigation within the context.
+        request_count: Requests served since the context was created.
+    """
+    context: 'BrowserContext'
+    page: 'Page'
+    request_count: int = 0
+
+
 class WebCrawler:
     """
     A web crawler for documentation sites using Playwright with stealth mode.
@@ -98,6 +140,14 @@ class WebCrawler:
     - Randomized delays between requests
     - Periodic browser context resets
     - Human-like browser fingerprint
+    
+    Pages of the same crawl depth are fetched concurrently, each request
+    using one of ``config.concurrency`` independent browser contexts.
+    
+    The first fetched page is also downloaded with a plain HTTP request.
+    If that static HTML carries about as much text and as many links as
+    the rendered page, the site does not need JavaScript and the rest of
+    the crawl uses plain HTTP requests instead of the browser.
     """
     
     def __init__(self, config: CrawlerConfig):
@@ -108,19 +158,56 @@ class WebCrawler:
             config: A CrawlerConfig object containing crawl settings.
         """
         self.config = config
-        self.visited_urls: Set[str] = set()
+        self.visited_urls: Set[str] = set()  # Every URL queued or skipped so far
         self.playwright = None
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.page: Optional[Page] = None
-        self.request_count = 0
+        self.browser: Optional['Browser'] = None
         self.max_requests_per_context = 10  # Reset context after this many requests
+        self._slots: Optional[asyncio.Queue] = None  # Idle _BrowserSlot objects
+        self._spare_context: Optional[asyncio.Future] = None  # Next (context, page) for rotation
+        self._closing_contexts: Set[asyncio.Future] = set()  # Retired contexts being closed
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._probe_lock: Optional[asyncio.Lock] = None
+        self._http_executor: Optional[ThreadPoolExecutor] = None
+        # None until the first page has been probed; True once plain HTTP is known to suffice
+        self._fast_mode: Optional[bool] = None
+        
+        # The base URL in the same canonical form as the links it is compared
+        # against (e.g. lowercase host, no default port)
+        self._base_url = normalize_url(config.base_url, config.base_url)
+        # Checks whether a link is internal and within the documentation path
+        self._in_scope = make_path_filter(self._base_url)
+        
+        # HTTP session for sites that don't require JavaScript rendering
+        import requests
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': config.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+        
+        # Keep a pooled keep-alive connection for every concurrent fetch (the
+        # default pool holds 10) and retry transient failures
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        adapter = HTTPAdapter(
+            pool_maxsize=max(10, config.concurrency),
+            max_retries=Retry(
+                total=config.max_retries,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+    async def _start_browser(self):
+        """Start the Playwright browser with one stealth context per concurrent fetch."""
+        from playwright.async_api import async_playwright
         
-    def _start_browser(self):
-        """Start the Playwright browser with stealth settings."""
         logger.info("Starting browser with stealth mode...")
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
             headless=True,
             args=[
                 '--disable-blink-features=AutomationControlled',
@@ -128,15 +215,25 @@ class WebCrawler:
                 '--disable-dev-shm-usage',
             ]
         )
-        self._create_context()
+        self._slots = asyncio.Queue()
+        for _ in range(max(1, self.config.concurrency)):
+            context, page = await self._create_context()
+            self._slots.put_nowait(_BrowserSlot(context=context, page=page))
+        self._spare_context = asyncio.ensure_future(self._create_context())
         logger.info("Browser started successfully")
     
-    def _create_context(self):
-        """Create a new browser context with stealth settings."""
-        if self.context:
-            self.context.close()
-        
-        self.context = self.browser.new_context(
+    async def _ensure_browser(self):
+        """Start the browser on first use, so crawls that never need it skip the launch."""
+        # Created here too, so fetch_page() also works outside crawl_async()
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self.browser is None:
+                await self._start_browser()
+    
+    async def _create_context(self) -> Tuple['BrowserContext', 'Page']:
+        """Create a new browser context with stealth settings and open a page in it."""
+        context = await self.browser.new_context(
             user_agent=self.config.user_agent,
             viewport={'width': 1920, 'height': 1080},
             locale='en-US',
@@ -145,68 +242,215 @@ class WebCrawler:
         )
         
         # Add stealth scripts to hide automation
-        self.context.add_init_script("""
+        await context.add_init_script("""
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
             Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
             Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
         """)
         
-        self.page = self.context.new_page()
-        self.request_count = 0
+        page = await context.new_page()
+        return context, page
+    
+    async def _rotate_context(self, slot: _BrowserSlot):
+        """
+        Replace a slot's context with the pre-created spare context.
+        
+        The spare is created in the background while other requests run,
+        and the retired context is closed in the background, so the
+        request that triggers the rotation doesn't wait for either.
+        
+        Args:
+            slot: The slot whose context has served enough requests.
+        """
+        logger.info("Resetting browser context to avoid detection...")
+        # Take the spare and start the next one without yielding in between,
+        # so concurrent rotations never share a context
+        spare = self._spare_context
+        self._spare_context = asyncio.ensure_future(self._create_context())
+        
+        retired = slot.context
+        slot.context, slot.page = await spare
+        slot.request_count = 0
+        
+        closing = asyncio.ensure_future(retired.close())
+        self._closing_contexts.add(closing)
+        closing.add_done_callback(self._closing_contexts.discard)
     
-    def _stop_browser(self):
+    async def _stop_browser(self):
         """Stop the Playwright browser."""
-        if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
+        if self.browser is None:
+            return
+        # Let pending context operations finish; closing the browser closes
+        # every remaining context, including the spare one
+        pending = [f for f in (self._spare_context, *self._closing_contexts) if f is not None]
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._closing_contexts.clear()
+        await self.browser.close()
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
+        self.browser = None
+        self.playwright = None
         logger.info("Browser stopped")
     
-    def _random_delay(self):
+    async def _random_delay(self):
         """Add a random delay to mimic human behavior."""
         delay = random.uniform(2.0, 4.0)  # Longer delays to avoid detection
-        time.sleep(delay)
+        await asyncio.sleep(delay)
+    
+    async def fetch_page(self, url: str) -> Optional[str]:
+        """
+        Fetch the HTML content of a single page.
+        
+        The first call probes whether the site needs JavaScript rendering;
+        afterwards pages are fetched over plain HTTP when it does not, and
+        with the browser otherwise (or when the HTTP request fails).
+        
+        Args:
+            url: The URL to fetch.
+            
+        Returns:
+            The HTML content as a string, or None if the fetch failed.
+        """
+        if self._fast_mode is None:
+            if self._probe_lock is None:
+                self._probe_lock = asyncio.Lock()
+            async with self._probe_lock:
+                if self._fast_mode is None:
+                    return await self._probe_fast_mode(url)
+        
+        if self._fast_mode:
+            content = await self._fetch_http_async(url)
+            if content is not None:
+                return content
+            logger.debug(f"HTTP fetch failed for {url}, retrying with browser")
+        
+        return await self._fetch_browser(url)
+    
+    async def _probe_fast_mode(self, url: str) -> Optional[str]:
+        """
+        Decide whether plain HTTP requests are enough to crawl the site.
+        
+        Fetches the URL both over HTTP and with the browser and compares the
+        visible text length and number of documentation links. Sets
+        ``self._fast_mode`` accordingly.
+        
+        Args:
+            url: The URL to probe (normally the crawl start URL).
+            
+        Returns:
+            The rendered HTML content of the URL, or None if it failed.
+        """
+        from bs4 import BeautifulSoup
+        
+        static_html, rendered_html = await asyncio.gather(
+            self._fetch_http_async(url),
+            self._fetch_browser(url),
+        )
+        
+        self._fast_mode = False
+        if static_html is not None and rendered_html is not None:
+            static_text = len(BeautifulSoup(static_html, 'lxml').get_text(strip=True))
+            rendered_text = len(BeautifulSoup(rendered_html, 'lxml').get_text(strip=True))
+            static_links = len(extract_links(static_html, url))
+            rendered_links = len(extract_links(rendered_html, url))
+            self._fast_mode = (static_text >= 0.9 * rendered_text
+                               and static_links >= 0.9 * rendered_links)
+        
+        if self._fast_mode:
+            logger.info("Site does not require JavaScript, using plain HTTP requests")
+        else:
+            logger.info("Site requires JavaScript rendering, using the browser")
+        return rendered_html
+    
+    def _fetch_http(self, url: str) -> Optional[str]:
+        """
+        Fetch a page with a plain HTTP GET request.
+        
+        Args:
+            url: The URL to fetch.
+            
+        Returns:
+            The HTML content as a string, or None if the request failed or
+            did not return an HTML document.
+        """
+        import requests
+        
+        try:
+            response = self.session.get(url, timeout=self.config.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.debug(f"HTTP request failed for {url}: {e}")
+            return None
+        
+        content_type = response.headers.get('Content-Type', 'text/html')
+        if 'html' not in content_type:
+            return None
+        
+        # requests decodes text/* responses without a charset as ISO-8859-1,
+        # which garbles UTF-8 pages; use the page's own declaration instead,
+        # or a guess from the content if it has none
+        if 'charset' not in content_type.lower():
+            match = _META_CHARSET_RE.search(response.content[:_META_CHARSET_SCAN_BYTES])
+            if match:
+                response.encoding = match.group(1).decode('ascii')
+            else:
+                response.encoding = response.apparent_encoding
+        return response.text
+    
+    async def _fetch_http_async(self, url: str) -> Optional[str]:
+        """Run _fetch_http() in one of the config.concurrency worker threads."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._http_executor, self._fetch_http, url)
     
-    def fetch_page(self, url: str) -> Optional[str]:
+    async def _fetch_browser(self, url: str) -> Optional[str]:
         """
         Fetch the HTML content of a single page using Playwright.
         
+        Waits for an idle browser context, so at most ``config.concurrency``
+        pages are loaded at the same time.
+        
         Args:
             url: The URL to fetch.
             
         Returns:
             The HTML content as a string, or None if the fetch failed.
         """
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+        
+        await self._ensure_browser()
+        slot = await self._slots.get()
         try:
+            # Add random delay to mimic human behavior
+            await self._random_delay()
+            
             # Reset context periodically to avoid detection
-            self.request_count += 1
-            if self.request_count >= self.max_requests_per_context:
-                logger.info("Resetting browser context to avoid detection...")
-                self._create_context()
+            slot.request_count += 1
+            if slot.request_count >= self.max_requests_per_context:
+                await self._rotate_context(slot)
+            
+            page = slot.page
             
             # Navigate to the page
-            self.page.goto(url, wait_until='domcontentloaded', timeout=self.config.timeout * 1000)
+            await page.goto(url, wait_until='domcontentloaded', timeout=self.config.timeout * 1000)
             
             # Wait for page to fully render
-            time.sleep(2)
+            await asyncio.sleep(2)
             
             # Try to wait for network to be idle
             try:
-                self.page.wait_for_load_state('networkidle', timeout=10000)
+                await page.wait_for_load_state('networkidle', timeout=10000)
             except PlaywrightTimeout:
                 pass  # Continue even if network doesn't become idle
             
             # Get the page content
-            content = self.page.content()
+            content = await page.evaluate(_SERIALIZE_PAGE_JS)
             
             # Check if we got a valid page (not a bot detection page)
             if 'JavaScript is disabled' in content or 'verify that you\'re not a robot' in content.lower():
                 logger.warning(f"Bot detection triggered for {url}, waiting longer...")
                 # Wait longer and try again
-                time.sleep(5)
-                content = self.page.content()
+                await asyncio.sleep(5)
+                content = await page.evaluate(_SERIALIZE_PAGE_JS)
                 
                 if 'JavaScript is disabled' in content:
                     return None  # Still blocked
@@ -219,101 +463,143 @@ class WebCrawler:
         except Exception as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
+        finally:
+            self._slots.put_nowait(slot)
+    
+    async def _fetch_logged(self, url: str, depth: int) -> Optional[str]:
+        """Log and fetch a single URL of the current crawl level."""
+        logger.info(f"Crawling [{depth}]: {url}")
+        return await self.fetch_page(url)
     
     def crawl(self) -> CrawlResult:
         """
         Perform a complete crawl starting from the base URL.
         
+        Synchronous wrapper around crawl_async(); must not be called from
+        a running event loop.
+        
+        Returns:
+            A CrawlResult containing all crawled pages and any errors.
+        """
+        return asyncio.run(self.crawl_async())
+    
+    async def crawl_async(self) -> CrawlResult:
+        """
+        Perform a complete crawl starting from the base URL.
+        
         Uses breadth-first search to traverse the documentation site,
         maintaining the order in which pages appear in the navigation.
+        All pages of one depth level are fetched concurrently, then
+        processed in discovery order, so the resulting page order is the
+        same as a sequential breadth-first crawl.
         
         Returns:
             A CrawlResult containing all crawled pages and any errors.
         """
         result = CrawlResult()
-        
-        # Start the browser
-        self._start_browser()
+        self._browser_lock = asyncio.Lock()
+        self._probe_lock = asyncio.Lock()
+        self._http_executor = ThreadPoolExecutor(max_workers=max(1, self.config.concurrency))
         
         try:
-            # Queue entries are (url, depth) tuples
-            queue: deque[Tuple[str, int]] = deque()
-            
-            # Normalize and enqueue the starting URL
-            start_url = normalize_url(self.config.base_url, self.config.base_url)
-            queue.append((start_url, 0))
+            # The normalized base URL forms the first crawl level
+            start_url = self._base_url
             self.visited_urls.add(start_url)
+            frontier: List[str] = [start_url]
+            depth = 0
+            # Extracted links already handled for an earlier page; they are
+            # absolute, so they always resolve to the same URL
+            seen_links: Set[str] = set()
+            # Digests of the pages crawled so far, to drop alias URLs that
+            # serve the same content
+            seen_content: Set[bytes] = set()
             
             logger.info(f"Starting crawl from: {start_url}")
             logger.info(f"Max depth: {self.config.max_depth}")
             
-            while queue:
-                current_url, depth = queue.popleft()
-                
+            while frontier:
                 # Skip if we've exceeded max depth
                 if depth > self.config.max_depth:
-                    logger.debug(f"Skipping {current_url}: exceeded max depth")
-                    continue
-                
-                logger.info(f"Crawling [{depth}] ({len(result.pages)} done): {current_url}")
-                
-                # Add random delay to mimic human behavior
-                self._random_delay()
+                    for url in frontier:
+                        logger.debug(f"Skipping {url}: exceeded max depth")
+                    break
                 
-                # Fetch the page content
-                html_content = self.fetch_page(current_url)
+                logger.info(f"Crawling depth {depth}: {len(frontier)} pages "
+                           f"({len(result.pages)} done)")
                 
-                if html_content is None:
-                    result.failed_urls.append(current_url)
-                    continue
+                # Plain HTTP requests of a level run back to back, so be polite
+                # between levels (the browser already waits before each page)
+                if depth > 0 and self._fast_mode and self.config.crawl_delay > 0:
+                    await asyncio.sleep(self.config.crawl_delay)
                 
-                # Check if we got actual content (not bot detection)
-                if 'JavaScript is disabled' in html_content:
-                    logger.warning(f"Skipping bot-blocked page: {current_url}")
-                    result.failed_urls.append(current_url)
-                    continue
-                
-                # Check if we got an error page (404-style content with HTTP 200)
-                if is_error_page(html_content):
-                    logger.warning(f"Skipping error page: {current_url}")
-                    result.failed_urls.append(current_url)
-                    continue
-                
-                # Extract page title and create CrawledPage
-                title = get_page_title(html_content)
-                page = CrawledPage(
-                    url=current_url,
-                    title=title,
-                    html_content=html_content,
-                    depth=depth
+                # Fetch the whole level concurrently; results keep frontier order
+                contents = await asyncio.gather(
+                    *(self._fetch_logged(url, depth) for url in frontier)
                 )
-                result.pages.append(page)
                 
-                # Extract and enqueue new links
-                links = extract_links(html_content, current_url)
+                next_frontier: List[str] = []
                 
-                for link in links:
-                    normalized_link = normalize_url(link, current_url)
-                    # Rewrite version-less URLs to include the version from base URL
-                    normalized_link = rewrite_versioned_url(normalized_link, self.config.base_url)
-                    
-                    # Skip already visited URLs
-                    if normalized_link in self.visited_urls:
+                for current_url, html_content in zip(frontier, contents):
+                    if html_content is None:
+                        result.failed_urls.append(current_url)
                         continue
                     
-                    # Skip external URLs (double-check)
-                    if not is_internal_link(normalized_link, self.config.base_url):
-                        result.skipped_urls.append(normalized_link)
+                    # Check if we got actual content (not bot detection)
+                    if 'JavaScript is disabled' in html_content:
+                        logger.warning(f"Skipping bot-blocked page: {current_url}")
+                        result.failed_urls.append(current_url)
                         continue
                     
-                    # Skip URLs outside the documentation path
-                    if not is_within_doc_path(normalized_link, self.config.base_url):
-                        result.skipped_urls.append(normalized_link)
+                    # Check if we got an error page (404-style content with HTTP 200)
+                    if is_error_page(html_content):
+                        logger.warning(f"Skipping error page: {current_url}")
+                        result.failed_urls.append(current_url)
                         continue
                     
-                    # Add to queue and mark as visited
-                    self.visited_urls.add(normalized_link)
-                    queue.append((normalized_link, depth + 1))
+                    # Extract page title and links with a single parse
+                    title, links = parse_page(html_content, current_url)
+                    
+                    # Skip duplicates of an already crawled page. Their links
+                    # are still followed: relative links resolve against the
+                    # alias URL and may lead to pages the original doesn't
+                    digest = hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest()
+                    if digest in seen_content:
+                        logger.info(f"Skipping duplicate page: {current_url}")
+                        result.skipped_urls.append(current_url)
+                    else:
+                        seen_content.add(digest)
+                        page = CrawledPage(
+                            url=current_url,
+                            title=title,
+                            html_content=html_content,
+                            depth=depth
+                        )
+                        result.pages.append(page)
+                    
+                    # Enqueue new links (parse_page() returns them normalized)
+                    for link in links:
+                        # Cross-links repeat on most pages of a docs site
+                        if link in seen_links:
+                            continue
+                        seen_links.add(link)
+                        
+                        # Rewrite version-less URLs to include the version from base URL
+                        normalized_link = rewrite_versioned_url(link, self._base_url)
+                        
+                        # Skip URLs that were already queued or skipped
+                        if normalized_link in self.visited_urls:
+                            continue
+                        self.visited_urls.add(normalized_link)
+                        
+                        if not self._in_scope(normalized_link):
+                            result.skipped_urls.append(normalized_link)
+                            continue
+                        
+                        # Add to the next level
+                        next_frontier.append(normalized_link)
+                
+                frontier = next_frontier
+                depth += 1
             
             logger.info(f"Crawl complete. Pages: {len(result.pages)}, "
                        f"Failed: {len(result.failed_urls)}, "
@@ -322,5 +608,6 @@ class WebCrawler:
             return result
         
         finally:
-            # Always stop the browser
-            self._stop_browser()
+            # Always stop the browser and the HTTP worker threads
+            await self._stop_browser()
+            self._http_executor.shutdown(wait=False)
@@ -10,13 +10,14 @@ Usage:
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 from pathlib import Path
 
 from .config import CrawlerConfig
 from .crawler import WebCrawler
-from .converter import PDFConverter
+from .converter import PDFConverter, CACHE_DIR
 from .merger import PDFMerger
 
 
@@ -85,7 +86,7 @@ Examples:
         '--delay',
         type=float,
         default=0.5,
-        help='Delay between requests in seconds (default: 0.5)'
+        help='Delay between crawl levels in seconds when fetching over plain HTTP (default: 0.5)'
     )
     
     parser.add_argument(
@@ -95,6 +96,28 @@ Examples:
         help='Request timeout in seconds (default: 30)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='Number of pages fetched in parallel (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of pages converted to PDF in parallel '
+             '(default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-render every page instead of reusing PDFs cached by '
+             'previous runs'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -108,6 +131,14 @@ Examples:
         help='Maximum number of pages to convert (for testing)'
     )
     
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Render all pages in a single wkhtmltopdf run instead of '
+             'converting and merging them one by one (faster; bookmarks '
+             'come from page headings)'
+    )
+    
     return parser.parse_args()
 
 
@@ -131,7 +162,8 @@ def main() -> int:
         output_filename=args.output,
         max_depth=args.max_depth,
         crawl_delay=args.delay,
-        timeout=args.timeout
+        timeout=args.timeout,
+        concurrency=args.concurrency
     )
     
     logger.info("=" * 60)
@@ -140,6 +172,7 @@ def main() -> int:
     logger.info(f"Base URL: {config.base_url}")
     logger.info(f"Output: {config.output_filename}")
     logger.info(f"Max Depth: {config.max_depth}")
+    logger.info(f"Concurrency: {config.concurrency}")
     if args.max_pages:
         logger.info(f"Max Pages: {args.max_pages}")
     logger.info("=" * 60)
@@ -147,7 +180,7 @@ def main() -> int:
     # Step 1: Crawl the documentation site
     logger.info("Phase 1: Crawling documentation site...")
     crawler = WebCrawler(config)
-    crawl_result = crawler.crawl()
+    crawl_result = asyncio.run(crawler.crawl_async())
     
     if not crawl_result.pages:
         logger.error("No pages were crawled successfully. Exiting.")
@@ -165,9 +198,28 @@ def main() -> int:
     
     # Step 2: Convert pages to PDF
     logger.info("Phase 2: Converting pages to PDF...")
-    converter = PDFConverter()
+    converter = PDFConverter(
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else str(CACHE_DIR)
+    )
     
     try:
+        if args.batch:
+            batch_result = converter.convert_pages_batch(
+                crawl_result.pages,
+                config.output_filename
+            )
+            
+            if batch_result.success:
+                logger.info("=" * 60)
+                logger.info("SUCCESS!")
+                logger.info(f"Output file: {batch_result.pdf_path}")
+                logger.info("=" * 60)
+                return 0
+            else:
+                logger.error(f"Failed to convert pages: {batch_result.error_message}")
+                return 1
+        
         conversion_results = converter.convert_pages(crawl_result.pages)
         
         successful_conversions = sum(1 for r in conversion_results if r.success)
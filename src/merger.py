@@ -8,15 +8,17 @@ table of contents.
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from dataclasses import dataclass
 
-from PyPDF2 import PdfMerger, PdfReader
-import fitz  # PyMuPDF for page numbering
-
 from .crawler import CrawledPage
 from .converter import PDFConversionResult
 
+# PyMuPDF is imported where it is used, so importing this module (e.g. for
+# the CLI's --help) doesn't load it
+if TYPE_CHECKING:
+    import fitz
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -55,10 +57,6 @@ class PDFMerger:
             print(f"Merged PDF: {result.output_path} ({result.total_pages} pages)")
     """
     
-    def __init__(self):
-        """Initialize the PDF merger."""
-        self.merger = PdfMerger()
-    
     def merge(
         self,
         conversion_results: List[PDFConversionResult],
@@ -76,40 +74,33 @@ class PDFMerger:
         Returns:
             A MergeResult indicating success or failure.
         """
+        import fitz  # PyMuPDF for merging and page numbering
+        
+        doc = fitz.open()
         try:
-            total_pages = 0
-            current_page = 0
+            toc = []
             
-            for i, (result, page) in enumerate(zip(conversion_results, original_pages)):
+            for result, page in zip(conversion_results, original_pages):
                 if not result.success or result.pdf_path is None:
                     logger.warning(f"Skipping failed conversion: {page.url}")
                     continue
                 
-                # Read the PDF to get page count
-                pdf_reader = PdfReader(result.pdf_path)
-                page_count = len(pdf_reader.pages)
-                
                 # Append PDF with a bookmark for navigation
-                self.merger.append(
-                    result.pdf_path,
-                    outline_item=page.title
-                )
-                
-                logger.debug(f"Added {page.title} ({page_count} pages)")
+                toc.append([1, page.title, len(doc) + 1])
+                with fitz.open(result.pdf_path) as page_doc:
+                    doc.insert_pdf(page_doc)
                 
-                total_pages += page_count
-                current_page += page_count
-            
-            # Write the merged PDF to a temporary location first
-            temp_output = output_path + '.temp'
-            with open(temp_output, 'wb') as output_file:
-                self.merger.write(output_file)
+                logger.debug(f"Added {page.title}")
             
-            # Add page numbers to the merged PDF
-            self._add_page_numbers(temp_output, output_path)
+            doc.set_toc(toc)
+            self._add_page_numbers(doc)
+            total_pages = len(doc)
             
-            # Remove temp file
-            Path(temp_output).unlink(missing_ok=True)
+            # Write the merged document once; garbage collection drops
+            # duplicated objects (e.g. fonts embedded by every page) and any
+            # uncompressed streams, images and fonts are deflated
+            doc.save(output_path, garbage=4, deflate=True,
+                     deflate_images=True, deflate_fonts=True)
             
             logger.info(f"Merged PDF created: {output_path} ({total_pages} pages)")
             
@@ -129,18 +120,25 @@ class PDFMerger:
             )
         
         finally:
-            self.merger.close()
+            doc.close()
     
-    def _add_page_numbers(self, input_path: str, output_path: str):
+    def _add_page_numbers(self, doc: 'fitz.Document'):
         """
-        Add page numbers to a PDF file.
+        Add page numbers to every page of a PDF document.
         
         Args:
-            input_path: Path to the input PDF without page numbers.
-            output_path: Path where the PDF with page numbers should be saved.
+            doc: The open document, modified in place.
         """
-        doc = fitz.open(input_path)
+        import fitz
+        
         total_pages = len(doc)
+        font_size = 9
+        
+        # Measure each digit once instead of measuring every page number
+        digit_widths = [
+            fitz.get_text_length(str(digit), fontname="helv", fontsize=font_size)
+            for digit in range(10)
+        ]
         
         for page_num in range(total_pages):
             page = doc[page_num]
@@ -154,8 +152,7 @@ class PDFMerger:
             text = str(page_num + 1)
             
             # Position at bottom center
-            font_size = 9
-            text_width = fitz.get_text_length(text, fontname="helv", fontsize=font_size)
+            text_width = sum(digit_widths[int(digit)] for digit in text)
             x = (width - text_width) / 2
             y = height - 15  # 15 points from bottom
             
@@ -168,8 +165,6 @@ class PDFMerger:
                 color=(0, 0, 0)
             )
         
-        doc.save(output_path)
-        doc.close()
         logger.debug(f"Added page numbers to {total_pages} pages")
     
     def merge_files(
@@ -192,25 +187,27 @@ class PDFMerger:
         Returns:
             A MergeResult indicating success or failure.
         """
+        import fitz  # PyMuPDF for merging and page numbering
+        
+        doc = fitz.open()
         try:
-            total_pages = 0
-            merger = PdfMerger()
+            toc = []
             
             for pdf_path, title in zip(pdf_paths, titles):
                 if not Path(pdf_path).exists():
                     logger.warning(f"PDF file not found: {pdf_path}")
                     continue
                 
-                pdf_reader = PdfReader(pdf_path)
-                page_count = len(pdf_reader.pages)
-                
-                merger.append(pdf_path, outline_item=title)
-                total_pages += page_count
+                # Each source is closed right after being copied, so only
+                # the merged document stays in memory
+                toc.append([1, title, len(doc) + 1])
+                with fitz.open(pdf_path) as page_doc:
+                    doc.insert_pdf(page_doc)
             
-            with open(output_path, 'wb') as output_file:
-                merger.write(output_file)
+            doc.set_toc(toc)
+            total_pages = len(doc)
             
-            merger.close()
+            doc.save(output_path, garbage=4, deflate=True)
             
             return MergeResult(
                 output_path=output_path,
@@ -226,3 +223,6 @@ class PDFMerger:
                 success=False,
                 error_message=error_msg
             )
+        
+        finally:
+            doc.close()
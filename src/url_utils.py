@@ -6,11 +6,111 @@ and link extraction. It ensures that only internal documentation
 links are followed while external links are filtered out.
 """
 
-from urllib.parse import urlparse, urljoin, urldefrag
-from typing import List, Set
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from urllib.parse import urlparse, urljoin, urldefrag, urlsplit, urlunsplit
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 import re
 
+# lxml is imported by the functions that parse HTML, so importing this
+# module doesn't load it
+if TYPE_CHECKING:
+    from lxml import etree
+
+# Extensions that indicate non-document resources (a tuple, so a single
+# str.endswith call checks them all)
+EXCLUDED_EXTENSIONS = (
+    '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico',
+    '.pdf', '.zip', '.tar', '.gz', '.exe', '.dmg', '.msi',
+    '.mp4', '.mp3', '.webm', '.woff', '.woff2', '.ttf', '.eot',
+    '.json', '.xml', '.yaml', '.yml'
+)
+
+# Common non-documentation path fragments
+EXCLUDED_PATH_PATTERNS = [
+    '/api/', '/assets/', '/static/', '/images/', '/css/', '/js/',
+    '/download/', '/downloads/', '/cdn/', '/_next/', '/_nuxt/',
+    '/blog/', '/knowledge/', '/knowledge?', '/lifecycle/', '/partners/',
+    '/support/', '/saml_login', '/find/', '/third-party-licenses/',
+    '/sites/default/files/', '/taxonomy/', '/oem-', '/gpl-source-code',
+    '/reference/eulas', '/support-programs', '/professional-services'
+]
+
+_EXCLUDED_PATH_RE = re.compile('|'.join(map(re.escape, EXCLUDED_PATH_PATTERNS)))
+
+# Version path segments: XX.XX, XX.XX.X, vX.X.X, latest, docs
+_VERSION_RE = re.compile(r'^(v?(\d+\.)*\d+|latest|docs)$', re.IGNORECASE)
+
+# urlparse() for URLs that are parsed over and over, such as the crawl's base
+# URL (passed with every link); ParseResult is immutable, so sharing is safe
+_parsed = lru_cache(maxsize=64)(urlparse)
+
+# Anything normalize_url() would rewrite (or reject) in an absolute http(s)
+# URL: a missing host (taken from the base URL), uppercase letters or a port
+# in the host, fragments, query strings, dot segments, characters stripped by
+# urlsplit(), IPv6 brackets, and empty params delimiters that are dropped when
+# the URL is reassembled
+_NEEDS_URLJOIN_RE = re.compile(r'^https?://(?:[/?;]|$|[^/]*[A-Z:])|[#?\s\\\[\]]|/\.|;$|;[;#]')
+
+# URLs whose scheme, host or query may need canonicalizing (uppercase letters
+# before the path, a port in the host, or a query string)
+_NEEDS_CANONICAL_RE = re.compile(r'^[^/]*[A-Z]|^[^/]*//[^/?]*[A-Z:]|\?')
+
+# Ports that are implied by the scheme and dropped from canonical URLs
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+# Query parameters that only track where a visitor came from
+_TRACKING_PARAM_PREFIX = 'utm_'
+
+
+# Relative hrefs that resolve by plain concatenation: no scheme, query,
+# params, fragment, whitespace, backslashes or brackets
+_SIMPLE_RELATIVE_RE = re.compile(r'[^:?#;\s\\\[\]]+')
+
+
+@lru_cache(maxsize=64)
+def _split_base(base_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a base URL into its origin and directory for fast relative joins.
+    
+    Args:
+        base_url: The URL relative links are resolved against.
+        
+    Returns:
+        The "scheme://host" origin and the directory path (ending in '/'),
+        or None if the base URL needs urljoin()'s full handling.
+    """
+    parsed = urlparse(base_url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    # urljoin() collapses empty segments and resolves dot segments
+    if '//' in parsed.path or '/.' in parsed.path:
+        return None
+    directory = parsed.path[:parsed.path.rfind('/') + 1] or '/'
+    return f"{parsed.scheme}://{parsed.netloc}", directory
+
+
+def _join_simple(url: str, base_url: str) -> Optional[str]:
+    """
+    Resolve a plain relative href like urljoin() does, without reparsing.
+    
+    Args:
+        url: The relative URL to resolve.
+        base_url: The base URL to resolve it against.
+        
+    Returns:
+        The absolute URL, or None if the href or base URL needs urljoin().
+    """
+    if (not _SIMPLE_RELATIVE_RE.fullmatch(url)
+            or '//' in url or '/.' in '/' + url):
+        return None
+    base = _split_base(base_url)
+    if base is None:
+        return None
+    origin, directory = base
+    if url.startswith('/'):
+        return origin + url
+    return origin + directory + url
+
 
 def normalize_url(url: str, base_url: str) -> str:
     """
@@ -19,8 +119,13 @@ def normalize_url(url: str, base_url: str) -> str:
     This function handles:
     - Relative URLs (e.g., "../page.html" or "subpage/")
     - Fragment removal (e.g., "#section" anchors)
+    - Lowercasing the scheme and host, and dropping default ports
+    - Sorting query parameters and dropping utm_* tracking parameters
     - Trailing slash normalization
     
+    Different spellings of the same page therefore normalize to the same
+    URL, so they are only crawled once.
+    
     Args:
         url: The URL to normalize (can be relative or absolute).
         base_url: The base URL to resolve relative URLs against.
@@ -32,11 +137,38 @@ def normalize_url(url: str, base_url: str) -> str:
         >>> normalize_url("../intro.html", "https://docs.example.com/guide/start/")
         'https://docs.example.com/intro.html'
     """
-    # Join with base URL to handle relative URLs
-    absolute_url = urljoin(base_url, url)
+    # Fast path: most hrefs on documentation sites are already absolute and
+    # canonical, and none of the steps below would change them
+    if url.startswith(('https://', 'http://')) and not _NEEDS_URLJOIN_RE.search(url):
+        if url.endswith('/') and '.' in url.split('/')[-2]:
+            return url.rstrip('/')
+        return url
     
-    # Remove URL fragments (e.g., #section-id)
-    defragged_url, _ = urldefrag(absolute_url)
+    # Join with base URL to handle relative URLs; plain relative hrefs have
+    # no fragment to remove
+    defragged_url = _join_simple(url, base_url)
+    if defragged_url is None:
+        absolute_url = urljoin(base_url, url)
+        
+        # Remove URL fragments (e.g., #section-id)
+        defragged_url, _ = urldefrag(absolute_url)
+    
+    # Canonicalize the host and query
+    if _NEEDS_CANONICAL_RE.search(defragged_url):
+        scheme, netloc, path, query, _ = urlsplit(defragged_url)
+        userinfo, at, host = netloc.rpartition('@')
+        host = host.lower()
+        default_port = _DEFAULT_PORTS.get(scheme)
+        if default_port and host.endswith(default_port):
+            host = host[:-len(default_port)]
+        if query:
+            # Parameters are compared and sorted as written, so values keep
+            # their original encoding
+            query = '&'.join(sorted(
+                param for param in query.split('&')
+                if param and not param.lower().startswith(_TRACKING_PARAM_PREFIX)
+            ))
+        defragged_url = urlunsplit((scheme, userinfo + at + host, path, query, ''))
     
     # Normalize trailing slashes for consistency
     # Keep trailing slash only for directory-like URLs
@@ -64,7 +196,7 @@ def rewrite_versioned_url(url: str, base_url: str) -> str:
         The URL with version injected if needed, or the original URL if no rewrite needed.
     """
     parsed_url = urlparse(url)
-    parsed_base = urlparse(base_url)
+    parsed_base = _parsed(base_url)
     
     # Only rewrite same-domain URLs
     if parsed_url.netloc and parsed_url.netloc.lower() != parsed_base.netloc.lower():
@@ -76,14 +208,11 @@ def rewrite_versioned_url(url: str, base_url: str) -> str:
     if len(base_parts) < 2 or len(url_parts) < 2:
         return url
     
-    # Version pattern: XX.XX, XX.XX.X, vX.X.X, latest, docs
-    version_pattern = re.compile(r'^(v?(\d+\.)*\d+|latest|docs)$', re.IGNORECASE)
-    
     # Find version segment in base URL
     base_version = None
     base_version_idx = None
     for i, part in enumerate(base_parts):
-        if version_pattern.match(part):
+        if _VERSION_RE.match(part):
             base_version = part
             base_version_idx = i
             break
@@ -94,7 +223,7 @@ def rewrite_versioned_url(url: str, base_url: str) -> str:
     # Check if URL is missing the version but has matching product path
     # E.g., base = [web-help, product, 25.10, subpath]
     #       url  = [web-help, product, subpath]
-    url_has_version = any(version_pattern.match(p) for p in url_parts)
+    url_has_version = any(_VERSION_RE.match(p) for p in url_parts)
     
     if url_has_version:
         return url  # URL already has a version
@@ -114,18 +243,20 @@ def rewrite_versioned_url(url: str, base_url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=4096)
 def get_domain(url: str) -> str:
     """
     Extract the domain (netloc) from a URL.
     
+    Results are cached: navigation links repeat on every page of a crawl.
+    
     Args:
         url: The URL to extract the domain from.
         
     Returns:
         The domain portion of the URL (e.g., "docs.example.com").
     """
-    parsed = urlparse(url)
-    return parsed.netloc.lower()
+    return urlparse(url).netloc.lower()
 
 
 def is_internal_link(url: str, base_url: str) -> bool:
@@ -150,16 +281,14 @@ def is_internal_link(url: str, base_url: str) -> bool:
         >>> is_internal_link("https://external.com/page", "https://docs.example.com/")
         False
     """
-    parsed_url = urlparse(url)
-    base_domain = get_domain(base_url)
+    url_domain = get_domain(url)
     
     # Relative URLs are always internal
-    if not parsed_url.netloc:
+    if not url_domain:
         return True
     
     # Compare domains (case-insensitive)
-    url_domain = parsed_url.netloc.lower()
-    return url_domain == base_domain
+    return url_domain == get_domain(base_url)
 
 
 def is_within_doc_path(url: str, base_url: str) -> bool:
@@ -193,7 +322,7 @@ def is_within_doc_path(url: str, base_url: str) -> bool:
         False
     """
     parsed_url = urlparse(url)
-    parsed_base = urlparse(base_url)
+    parsed_base = _parsed(base_url)
     
     # Must be same domain first
     if parsed_url.netloc.lower() != parsed_base.netloc.lower():
@@ -213,13 +342,10 @@ def is_within_doc_path(url: str, base_url: str) -> bool:
     base_parts = base_path.split('/')
     url_parts = url_path.split('/')
     
-    # Try to find and remove version segment from base path
-    version_pattern = re.compile(r'^(v?(\d+\.)*\d+|latest|docs)$', re.IGNORECASE)
-    
     # Build version-less base path
     base_no_version = []
     for part in base_parts:
-        if not version_pattern.match(part):
+        if not _VERSION_RE.match(part):
             base_no_version.append(part)
     
     base_path_no_version = '/'.join(base_no_version)
@@ -227,7 +353,7 @@ def is_within_doc_path(url: str, base_url: str) -> bool:
     # Build version-less URL path for comparison
     url_no_version = []
     for part in url_parts:
-        if not version_pattern.match(part):
+        if not _VERSION_RE.match(part):
             url_no_version.append(part)
     
     url_path_no_version = '/'.join(url_no_version)
@@ -239,12 +365,46 @@ def is_within_doc_path(url: str, base_url: str) -> bool:
     return False
 
 
+def make_path_filter(base_url: str) -> Callable[[str], bool]:
+    """
+    Build a fast check for whether URLs are internal and within the
+    documentation path of a fixed base URL.
+    
+    Equivalent to ``is_internal_link(url, base_url) and
+    is_within_doc_path(url, base_url)``, but most links share the base URL's
+    prefix and are accepted with a single string comparison; only the
+    others (e.g. version-less paths) go through the full checks.
+    
+    Args:
+        base_url: The base URL of the crawl.
+        
+    Returns:
+        A function taking a normalized URL and returning True if it is in
+        scope, False otherwise.
+    """
+    # The prefix's path always starts with '/', so the host part of a
+    # matching URL can't be extended (e.g. host.evil.com)
+    parsed_base = urlparse(base_url)
+    prefix = f"{parsed_base.scheme}://{parsed_base.netloc}{parsed_base.path.rstrip('/') or '/'}"
+    
+    def in_scope(url: str) -> bool:
+        if url.startswith(prefix):
+            return True
+        # is_within_doc_path() also requires the same domain, so is_internal_link()
+        # would only add relative URLs, which it then rejects
+        return is_within_doc_path(url, base_url)
+    
+    return in_scope
+
+
+@lru_cache(maxsize=4096)
 def is_valid_doc_page(url: str) -> bool:
     """
     Check if a URL points to a valid documentation page (not a resource file).
     
     This filters out non-document resources like images, stylesheets, scripts,
-    and downloadable files that should not be converted to PDF.
+    and downloadable files that should not be converted to PDF. Results are
+    cached, like get_domain().
     
     Args:
         url: The URL to validate.
@@ -252,74 +412,149 @@ def is_valid_doc_page(url: str) -> bool:
     Returns:
         True if the URL likely points to a documentation page, False otherwise.
     """
-    # Extensions that indicate non-document resources
-    excluded_extensions = {
-        '.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico',
-        '.pdf', '.zip', '.tar', '.gz', '.exe', '.dmg', '.msi',
-        '.mp4', '.mp3', '.webm', '.woff', '.woff2', '.ttf', '.eot',
-        '.json', '.xml', '.yaml', '.yml'
-    }
-    
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-    
-    # Check if URL ends with an excluded extension
-    for ext in excluded_extensions:
-        if path.endswith(ext):
-            return False
-    
-    # Exclude common non-documentation paths
-    excluded_patterns = [
-        '/api/', '/assets/', '/static/', '/images/', '/css/', '/js/',
-        '/download/', '/downloads/', '/cdn/', '/_next/', '/_nuxt/',
-        '/blog/', '/knowledge/', '/knowledge?', '/lifecycle/', '/partners/',
-        '/support/', '/saml_login', '/find/', '/third-party-licenses/',
-        '/sites/default/files/', '/taxonomy/', '/oem-', '/gpl-source-code',
-        '/reference/eulas', '/support-programs', '/professional-services'
-    ]
-    
-    for pattern in excluded_patterns:
-        if pattern in path.lower():
-            return False
-    
-    return True
+    path = urlparse(url).path.lower()
+    
+    # Reject resource files and common non-documentation paths
+    return not path.endswith(EXCLUDED_EXTENSIONS) and _EXCLUDED_PATH_RE.search(path) is None
 
 
-def extract_links(html_content: str, base_url: str) -> List[str]:
+# Tags whose own strings BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+
+def _parse_html(html_content: str) -> Optional['etree._Element']:
     """
-    Extract all valid internal documentation links from HTML content.
-    
-    This function parses the HTML, finds all anchor tags, and filters
-    the links to include only internal documentation pages.
+    Parse HTML with lxml's HTML parser.
     
     Args:
         html_content: The raw HTML content to parse.
-        base_url: The base URL for resolving relative links and domain checking.
         
     Returns:
-        A list of normalized, unique internal URLs found in the HTML.
+        The root element, or None if the document is empty.
+    """
+    from lxml import etree
+    
+    # Parse UTF-8 bytes: lxml rejects str input with an XML encoding declaration
+    parser = etree.HTMLParser(encoding='utf-8')
+    return etree.fromstring(html_content.encode('utf-8'), parser)
+
+
+def _text_content(element: 'etree._Element') -> str:
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    links: Set[str] = set()
+    Get the text of an element like BeautifulSoup's get_text().
+    
+    Comments, <template> subtrees and the contents of script/style-like
+    tags are skipped, and whitespace-only strings are collapsed to a single
+    space or newline.
+    """
+    parts = []
+    include_own = element.tag not in _NON_TEXT_TAGS
+    
+    def add(text: Optional[str]) -> None:
+        if text and include_own:
+            if not text.strip(' \t\n\r\f'):
+                text = '\n' if '\n' in text else ' '
+            parts.append(text)
+    
+    add(element.text)
+    for child in element:
+        # Comments and processing instructions have a non-string tag
+        if isinstance(child.tag, str) and child.tag != 'template':
+            parts.append(_text_content(child))
+        add(child.tail)
+    return ''.join(parts)
+
+
+# Hrefs that never point to another page, most common first
+_SKIP_HREF_PREFIXES = ('#', 'javascript:', 'mailto:', 'tel:', 'data:')
+
+
+def _links_from_tree(root: Optional['etree._Element'], base_url: str) -> List[str]:
+    """Collect the internal documentation links of a parsed page (see extract_links)."""
+    # Insertion-ordered dict: deduplicates while keeping document order
+    links: Dict[str, None] = {}
+    if root is None:
+        return []
+    
+    # Same check as is_internal_link(), with the base domain looked up once
+    base_domain = get_domain(base_url)
     
     # Find all anchor tags with href attributes
-    for anchor in soup.find_all('a', href=True):
-        href = anchor['href']
+    for anchor in root.iter('a'):
+        href = anchor.get('href')
         
-        # Skip empty hrefs, javascript links, and mailto links
-        if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
+        # Skip empty hrefs, fragments, and javascript/mailto/tel/data links
+        if not href or href.startswith(_SKIP_HREF_PREFIXES):
             continue
         
         # Normalize the URL
         normalized = normalize_url(href, base_url)
         
         # Apply filters: must be internal and a valid doc page
-        if is_internal_link(normalized, base_url) and is_valid_doc_page(normalized):
-            links.add(normalized)
+        domain = get_domain(normalized)
+        if (not domain or domain == base_domain) and is_valid_doc_page(normalized):
+            links[normalized] = None
     
     return list(links)
 
 
+def _title_from_tree(root: Optional['etree._Element']) -> str:
+    """Get the title of a parsed page (see get_page_title)."""
+    if root is None:
+        return "Untitled Page"
+    
+    # Try to get title from <title> tag (its content is always plain text)
+    title = next(root.iter('title'), None)
+    if title is not None and title.text:
+        return title.text.strip()
+    
+    # Try to get from first <h1>
+    h1 = next(root.iter('h1'), None)
+    if h1 is not None and not any(a.tag == 'template' for a in h1.iterancestors()):
+        text = _text_content(h1)
+        if text:
+            return text.strip()
+    
+    return "Untitled Page"
+
+
+def parse_page(html_content: str, base_url: str) -> Tuple[str, List[str]]:
+    """
+    Extract the title and the internal documentation links of a page.
+    
+    Equivalent to calling get_page_title() and extract_links(), but the
+    HTML is only parsed once.
+    
+    Args:
+        html_content: The raw HTML content to parse.
+        base_url: The base URL for resolving relative links and domain checking.
+        
+    Returns:
+        A tuple of the page title and the list of normalized, unique
+        internal URLs found in the HTML.
+    """
+    root = _parse_html(html_content)
+    return _title_from_tree(root), _links_from_tree(root, base_url)
+
+
+def extract_links(html_content: str, base_url: str) -> List[str]:
+    """
+    Extract all valid internal documentation links from HTML content.
+    
+    This function parses the HTML, finds all anchor tags, and filters
+    the links to include only internal documentation pages.
+    
+    Args:
+        html_content: The raw HTML content to parse.
+        base_url: The base URL for resolving relative links and domain checking.
+        
+    Returns:
+        A list of normalized, unique internal URLs found in the HTML,
+        in the order they first appear.
+    """
+    return _links_from_tree(_parse_html(html_content), base_url)
+
+
 def get_page_title(html_content: str) -> str:
     """
     Extract the page title from HTML content.
@@ -335,15 +570,4 @@ def get_page_title(html_content: str) -> str:
     Returns:
         The extracted page title as a string.
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    
-    # Try to get title from <title> tag
-    if soup.title and soup.title.string:
-        return soup.title.string.strip()
-    
-    # Try to get from first <h1>
-    h1 = soup.find('h1')
-    if h1 and h1.get_text():
-        return h1.get_text().strip()
-    
-    return "Untitled Page"
+    return _title_from_tree(_parse_html(html_content))
@@ -0,0 +1,221 @@
+"""
+Unit Tests for the HTML to PDF Converter.
+
+These tests validate the HTML sanitization applied to crawled pages
+before they are handed to wkhtmltopdf.
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.converter import sanitize_html, PDFConverter
+from src.crawler import CrawledPage
+
+
+class TestSanitizeHtml(unittest.TestCase):
+    """Tests for the sanitize_html function."""
+
+    def test_navigation_tags_removed(self):
+        """Test that nav/header/footer/aside/script tags are removed."""
+        html = '''
+        <html><body>
+            <nav>Site navigation</nav>
+            <header>Header</header>
+            <div><p>Documentation text</p></div>
+            <aside>Related</aside>
+            <footer>Footer</footer>
+            <script>var tracking = 1;</script>
+        </body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Documentation text", result)
+        for removed in ("Site navigation", "Header", "Related", "Footer", "tracking"):
+            self.assertNotIn(removed, result)
+
+    def test_commented_out_script_keeps_content(self):
+        """Test that a <script> inside a comment doesn't remove later content."""
+        html = '''
+        <html><body><main>
+            <!-- disabled: <script src="x.js"> -->
+            <h2>Installation</h2>
+            <p>Step one</p>
+            <script>var tracking = 1;</script>
+        </main></body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Installation", result)
+        self.assertIn("Step one", result)
+        self.assertNotIn("tracking", result)
+
+    def test_navigation_classes_removed(self):
+        """Test that elements with navigation class names are removed."""
+        html = '''
+        <html><body>
+            <div class="md-sidebar md-sidebar--primary">Sidebar</div>
+            <div class="Cookie-Consent">Accept cookies</div>
+            <div class="prose"><p>Body text</p></div>
+        </body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Body text", result)
+        self.assertNotIn("Sidebar", result)
+        self.assertNotIn("Accept cookies", result)
+
+    def test_navigation_ids_removed(self):
+        """Test that elements with navigation IDs are removed."""
+        html = '''
+        <html><body>
+            <div id="TOC-panel">Table of contents</div>
+            <div id="intro"><p>Intro text</p></div>
+        </body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Intro text", result)
+        self.assertNotIn("Table of contents", result)
+
+    def test_nested_positioned_elements(self):
+        """Test that nested fixed/absolute elements are removed without errors."""
+        html = '''
+        <html><body>
+            <div style="position: fixed">Outer
+                <div style="position: absolute">Inner</div>
+            </div>
+            <p>Page text</p>
+        </body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Page text", result)
+        self.assertNotIn("Outer", result)
+        self.assertNotIn("Inner", result)
+
+    def test_other_fixed_styles_kept(self):
+        """Test that only fixed/absolute positioning marks an element as an overlay."""
+        html = '''
+        <html><body>
+            <div style="position: relative; background-attachment: fixed">Hero text</div>
+            <div style="POSITION : Absolute">Popup</div>
+        </body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("Hero text", result)
+        self.assertNotIn("Popup", result)
+
+    def test_main_content_extracted(self):
+        """Test that only the <main> element is kept when present."""
+        html = '''
+        <html>
+        <head><title>Guide</title></head>
+        <body>
+            <div class="banner-left">Promo</div>
+            <main><h1>Guide</h1><p>Main text</p></main>
+            <div>Unrelated trailing block</div>
+        </body>
+        </html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertIn("<title>Guide</title>", result)
+        self.assertIn("Main text", result)
+        self.assertNotIn("Unrelated trailing block", result)
+
+    def test_empty_anchors_removed(self):
+        """Test that anchors without text or images are removed."""
+        html = '''
+        <html><body><main>
+            <h2>Heading<a href="#heading"></a></h2>
+            <a href="other.html">Other page</a>
+        </main></body></html>
+        '''
+        result = sanitize_html(html)
+
+        self.assertNotIn('href="#heading"', result)
+        self.assertIn("Other page", result)
+
+    def test_cleanup_css_injected(self):
+        """Test that the cleanup stylesheet is added to the document head."""
+        html = '<html><head><title>T</title></head><body><p>x</p></body></html>'
+        result = sanitize_html(html)
+
+        self.assertIn("position: static !important", result)
+
+    def test_cleanup_css_linked(self):
+        """Test that a cleanup stylesheet URL is linked instead of inlined."""
+        html = '<html><head><title>T</title></head><body><p>x</p></body></html>'
+        result = sanitize_html(html, stylesheet_url="file:///tmp/cleanup.css")
+
+        self.assertIn('<link href="file:///tmp/cleanup.css" rel="stylesheet"/>', result)
+        self.assertNotIn("position: static !important", result)
+
+    def test_base_tag_added_first_in_head(self):
+        """Test that the page URL is added as the first <head> element."""
+        html = '<html><head><title>T</title></head><body><main>x</main></body></html>'
+        result = sanitize_html(html, base_url="https://docs.example.com/guide/")
+
+        self.assertIn('<head><base href="https://docs.example.com/guide/"/>', result)
+
+    def test_no_base_tag_by_default(self):
+        """Test that no <base> tag is added without a base URL."""
+        html = '<html><head><title>T</title></head><body><main>x</main></body></html>'
+        self.assertNotIn("<base", sanitize_html(html))
+
+
+class TestPageCache(unittest.TestCase):
+    """Tests for the PDFConverter rendered page cache."""
+
+    def test_cached_pages_not_rendered_again(self):
+        """Test that a page rendered by a previous run is copied from the cache."""
+        page = CrawledPage(url="https://docs.example.com/", title="Home",
+                           html_content="<html><body><main>x</main></body></html>", depth=0)
+
+        def render(command):
+            Path(command[-1]).write_bytes(b"%PDF-1.4 rendered")
+
+        render_counts = []
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                converter = PDFConverter(wkhtmltopdf_path="wkhtmltopdf", cache_dir=cache_dir)
+                try:
+                    with patch('src.converter._run_wkhtmltopdf', side_effect=render) as run:
+                        output_path = str(Path(converter.temp_dir) / "page.pdf")
+                        result = converter.convert_page(page, output_path)
+                        self.assertTrue(result.success)
+                        self.assertEqual(Path(output_path).read_bytes(), b"%PDF-1.4 rendered")
+                        render_counts.append(run.call_count)
+                finally:
+                    converter.cleanup()
+
+        # Only the first run invoked wkhtmltopdf
+        self.assertEqual(render_counts, [1, 0])
+
+    def test_cache_key_covers_version_and_executable(self):
+        """Test that a new cache version or wkhtmltopdf binary misses the cache."""
+        page = CrawledPage(url="https://docs.example.com/", title="Home",
+                           html_content="<html><body><main>x</main></body></html>", depth=0)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            converter = PDFConverter(wkhtmltopdf_path="wkhtmltopdf", cache_dir=cache_dir)
+            other = PDFConverter(wkhtmltopdf_path="/opt/wkhtmltopdf", cache_dir=cache_dir)
+            try:
+                cache_path = converter._cache_path(page)
+                self.assertNotEqual(other._cache_path(page), cache_path)
+                with patch('src.converter.CACHE_VERSION', 'next'):
+                    self.assertNotEqual(converter._cache_path(page), cache_path)
+            finally:
+                converter.cleanup()
+                other.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,10 +5,11 @@ These tests validate the crawler's state management, URL tracking,
 and crawl behavior.
 """
 
+import asyncio
 import unittest
 import sys
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, MagicMock
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,6 +30,7 @@ class TestCrawlerConfig(unittest.TestCase):
         self.assertEqual(config.crawl_delay, 0.5)
         self.assertEqual(config.timeout, 30)
         self.assertEqual(config.max_retries, 3)
+        self.assertEqual(config.concurrency, 4)
     
     def test_custom_values(self):
         """Test that custom configuration values override defaults."""
@@ -82,11 +84,67 @@ class TestWebCrawler(unittest.TestCase):
         self.assertIn("Accept", headers)
         self.assertIn("Mozilla", headers["User-Agent"])
     
-    @patch.object(WebCrawler, 'fetch_page')
-    def test_crawl_respects_max_depth(self, mock_fetch):
+    def _http_response(self, body: bytes, content_type: str):
+        """Build a response the way requests does for a real request."""
+        import requests
+        
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers['Content-Type'] = content_type
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+    
+    def test_http_utf8_without_charset_header(self):
+        """Test that UTF-8 pages served without a charset are decoded correctly."""
+        html = '<html><head><title>Café</title></head><body><p>Café au lait</p></body></html>'
+        self.crawler.session.get = Mock(
+            return_value=self._http_response(html.encode('utf-8'), 'text/html'))
+        
+        self.assertEqual(self.crawler._fetch_http("https://docs.example.com/"), html)
+    
+    def test_http_meta_charset_used(self):
+        """Test that a <meta charset> is used when the header has no charset."""
+        html = ('<html><head><meta charset="windows-1252"><title>Café</title></head>'
+                '<body><p>Price: 5 €</p></body></html>')
+        self.crawler.session.get = Mock(
+            return_value=self._http_response(html.encode('cp1252'), 'text/html'))
+        
+        self.assertEqual(self.crawler._fetch_http("https://docs.example.com/"), html)
+    
+    def test_fast_mode_used_for_static_sites(self):
+        """Test that static sites are crawled over HTTP after the first page."""
+        html = '<html><head><title>Root</title></head><body><p>Text</p></body></html>'
+        self.crawler._fetch_http = Mock(return_value=html)
+        
+        async def fetch_browser(url):
+            return html
+        self.crawler._fetch_browser = Mock(side_effect=fetch_browser)
+        
+        result = self.crawler.crawl()
+        
+        self.assertTrue(self.crawler._fast_mode)
+        self.assertEqual(len(result.pages), 1)
+        self.assertEqual(self.crawler._fetch_browser.call_count, 1)
+    
+    def test_fetch_page_outside_crawl(self):
+        """Test that fetch_page() can be awaited without running a crawl."""
+        html = '<html><head><title>Root</title></head><body><p>Text</p></body></html>'
+        self.crawler._fetch_http = Mock(return_value=html)
+        
+        async def fetch_browser(url):
+            return html
+        self.crawler._fetch_browser = fetch_browser
+        
+        content = asyncio.run(self.crawler.fetch_page("https://docs.example.com/"))
+        
+        self.assertEqual(content, html)
+        self.assertTrue(self.crawler._fast_mode)
+    
+    def test_crawl_respects_max_depth(self):
         """Test that crawling respects max_depth setting."""
-        # Configure mock to return HTML with links
-        def return_html(url):
+        # Fake fetch_page that returns HTML with links
+        async def return_html(url):
             if "page" not in url:
                 # Root page
                 return '''
@@ -118,16 +176,83 @@ class TestWebCrawler(unittest.TestCase):
             else:
                 return '<html><head><title>Page</title></head><body></body></html>'
         
-        mock_fetch.side_effect = return_html
-        
         # Set max_depth to 1 (should only get root and page1)
         self.config.max_depth = 1
         crawler = WebCrawler(self.config)
+        crawler.fetch_page = return_html
         result = crawler.crawl()
         
         # Should have crawled root (depth 0) and page1 (depth 1)
         # page2 would be at depth 2, which exceeds max_depth
         self.assertLessEqual(len(result.pages), 2)
+    
+    def test_skipped_urls_recorded_once(self):
+        """Test that an out-of-scope link shared by several pages is skipped once."""
+        async def fetch_page(url):
+            return f'''
+            <html>
+            <head><title>{url}</title></head>
+            <body>
+                <a href="page1.html">Page 1</a>
+                <a href="/about/team.html">Team</a>
+            </body>
+            </html>
+            '''
+        
+        self.config.base_url = "https://docs.example.com/guide/"
+        crawler = WebCrawler(self.config)
+        crawler.fetch_page = fetch_page
+        result = crawler.crawl()
+        
+        self.assertEqual(len(result.pages), 2)
+        self.assertEqual(result.skipped_urls, ["https://docs.example.com/about/team.html"])
+    
+    def test_duplicate_content_skipped(self):
+        """Test that a page with the same content as a crawled page is skipped."""
+        async def fetch_page(url):
+            return '''
+            <html>
+            <head><title>Home</title></head>
+            <body><a href="index.html">Home</a></body>
+            </html>
+            '''
+        
+        self.crawler.fetch_page = fetch_page
+        result = self.crawler.crawl()
+        
+        self.assertEqual(len(result.pages), 1)
+        self.assertEqual(result.skipped_urls, ["https://docs.example.com/index.html"])
+    
+    def test_duplicate_content_links_followed(self):
+        """Test that relative links on a duplicate page are still crawled."""
+        async def fetch_page(url):
+            if url.endswith("/guide/"):
+                return '''
+                <html>
+                <head><title>Guide</title></head>
+                <body><a href="setup">Setup</a> <a href="setup/">Setup</a></body>
+                </html>
+                '''
+            if url.rstrip("/").endswith("/setup"):
+                # Both aliases serve the same page
+                return '''
+                <html>
+                <head><title>Setup</title></head>
+                <body><a href="install.html">Install</a></body>
+                </html>
+                '''
+            if url == "https://docs.example.com/guide/setup/install.html":
+                return '<html><head><title>Install</title></head><body></body></html>'
+            return None
+        
+        self.config.base_url = "https://docs.example.com/guide/"
+        crawler = WebCrawler(self.config)
+        crawler.fetch_page = fetch_page
+        result = crawler.crawl()
+        
+        urls = [page.url for page in result.pages]
+        self.assertIn("https://docs.example.com/guide/setup/install.html", urls)
+        self.assertEqual(len(result.pages), 3)
 
 
 class TestCrawledPage(unittest.TestCase):
@@ -19,7 +19,9 @@ from src.url_utils import (
     is_valid_doc_page,
     extract_links,
     get_page_title,
-    get_domain
+    parse_page,
+    get_domain,
+    make_path_filter
 )
 
 
@@ -40,6 +42,13 @@ class TestNormalizeUrl(unittest.TestCase):
         expected = "https://docs.example.com/guide/overview.html"
         self.assertEqual(normalize_url(url, base), expected)
     
+    def test_relative_url_from_page(self):
+        """Test that relative URLs resolve against the base page's directory."""
+        base = "https://docs.example.com/guide/start/intro.html"
+        url = "next.html"
+        expected = "https://docs.example.com/guide/start/next.html"
+        self.assertEqual(normalize_url(url, base), expected)
+    
     def test_absolute_url_same_domain(self):
         """Test that absolute URLs on same domain are returned as-is."""
         base = "https://docs.example.com/guide/"
@@ -47,6 +56,13 @@ class TestNormalizeUrl(unittest.TestCase):
         expected = "https://docs.example.com/api/reference.html"
         self.assertEqual(normalize_url(url, base), expected)
     
+    def test_absolute_url_fragment_removal(self):
+        """Test that fragments are removed from absolute URLs."""
+        base = "https://docs.example.com/guide/"
+        url = "https://docs.example.com/api/reference.html#methods"
+        expected = "https://docs.example.com/api/reference.html"
+        self.assertEqual(normalize_url(url, base), expected)
+    
     def test_fragment_removal(self):
         """Test that URL fragments are removed."""
         base = "https://docs.example.com/"
@@ -55,6 +71,19 @@ class TestNormalizeUrl(unittest.TestCase):
         self.assertNotIn('#', result)
         self.assertEqual(result, "https://docs.example.com/page.html")
     
+    def test_scheme_and_host_lowercased(self):
+        """Test that the scheme and host are lowercased and default ports dropped."""
+        base = "https://docs.example.com/"
+        url = "HTTPS://Docs.Example.COM:443/Guide/"
+        self.assertEqual(normalize_url(url, base), "https://docs.example.com/Guide/")
+    
+    def test_query_canonicalized(self):
+        """Test that query parameters are sorted and tracking parameters dropped."""
+        base = "https://docs.example.com/guide/"
+        url = "search.html?q=pdf&utm_source=news&lang=en"
+        expected = "https://docs.example.com/guide/search.html?lang=en&q=pdf"
+        self.assertEqual(normalize_url(url, base), expected)
+    
     def test_root_relative_url(self):
         """Test normalizing a root-relative URL."""
         base = "https://docs.example.com/deep/nested/path/"
@@ -109,6 +138,26 @@ class TestIsInternalLink(unittest.TestCase):
         self.assertTrue(is_internal_link(url, base))
 
 
+class TestMakePathFilter(unittest.TestCase):
+    """Tests for the make_path_filter function."""
+    
+    def setUp(self):
+        self.in_scope = make_path_filter("https://docs.example.com/product/25.10/")
+    
+    def test_page_under_base_path(self):
+        """Test that pages under the base path are in scope."""
+        self.assertTrue(self.in_scope("https://docs.example.com/product/25.10/install/"))
+    
+    def test_versionless_page(self):
+        """Test that version-less documentation paths are in scope."""
+        self.assertTrue(self.in_scope("https://DOCS.example.com/product/install/"))
+    
+    def test_other_path_or_host(self):
+        """Test that other paths and hosts are out of scope."""
+        self.assertFalse(self.in_scope("https://docs.example.com/blog/post.html"))
+        self.assertFalse(self.in_scope("https://docs.example.com.evil.com/product/25.10/"))
+
+
 class TestIsValidDocPage(unittest.TestCase):
     """Tests for the is_valid_doc_page function."""
     
@@ -202,6 +251,17 @@ class TestExtractLinks(unittest.TestCase):
         
         self.assertEqual(len(links), 1)
     
+    def test_data_links_skipped(self):
+        """Test that data: links are skipped."""
+        html = '''
+        <a href="data:text/html,hello">Inline</a>
+        <a href="page.html">Page</a>
+        '''
+        base = "https://docs.example.com/"
+        links = extract_links(html, base)
+        
+        self.assertEqual(links, ["https://docs.example.com/page.html"])
+    
     def test_hash_only_links_skipped(self):
         """Test that pure fragment links are skipped."""
         html = '''
@@ -226,6 +286,23 @@ class TestExtractLinks(unittest.TestCase):
         
         self.assertEqual(len(links), 1)
         self.assertIn("https://docs.example.com/guide.html", links)
+    
+    def test_links_in_document_order(self):
+        """Test that duplicate links are dropped and document order is kept."""
+        html = '''
+        <a href="zeta.html">Zeta</a>
+        <a href="alpha.html">Alpha</a>
+        <a href="zeta.html#intro">Zeta again</a>
+        <a href="mid.html">Mid</a>
+        '''
+        base = "https://docs.example.com/"
+        links = extract_links(html, base)
+        
+        self.assertEqual(links, [
+            "https://docs.example.com/zeta.html",
+            "https://docs.example.com/alpha.html",
+            "https://docs.example.com/mid.html",
+        ])
 
 
 class TestGetPageTitle(unittest.TestCase):
@@ -256,6 +333,28 @@ class TestGetPageTitle(unittest.TestCase):
         self.assertEqual(get_page_title(html), "Untitled Page")
 
 
+class TestParsePage(unittest.TestCase):
+    """Tests for the parse_page function."""
+    
+    def test_title_and_links(self):
+        """Test that parse_page matches get_page_title and extract_links."""
+        html = '''
+        <html>
+        <head><title>Guide</title></head>
+        <body>
+            <a href="install.html">Install</a>
+            <a href="https://external.com/">External</a>
+        </body>
+        </html>
+        '''
+        base = "https://docs.example.com/guide/"
+        title, links = parse_page(html, base)
+        
+        self.assertEqual(title, get_page_title(html))
+        self.assertEqual(links, extract_links(html, base))
+        self.assertEqual(links, ["https://docs.example.com/guide/install.html"])
+
+
 class TestGetDomain(unittest.TestCase):
     """Tests for the get_domain function."""
     